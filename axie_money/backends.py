@@ -0,0 +1,53 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Dict, List
+
+BACKENDS: Dict[str, str] = {
+    "columns": "axie_money.columns",
+    "inventory": "axie_money.inventory",
+    "sketches": "axie_money.sketches",
+    "sqlite": "axie_money.ledger",
+}
+
+
+def register_backend(name: str, module: str) -> None:
+    """Registers a lazily imported backend.
+
+    :param name: The name the backend is looked up by.
+    :param module: Dotted path of the module implementing the backend. The
+        module is not imported until the backend is first requested.
+    """
+    BACKENDS[name] = module
+
+
+def get_backend(name: str) -> ModuleType:
+    """Imports a backend on first use.
+
+    :param name: The name of a registered backend.
+    :returns: The module implementing the backend.
+    """
+    try:
+        module = BACKENDS[name]
+    except KeyError:
+        raise LookupError("Unknown backend {!r}.".format(name)) from None
+
+    return importlib.import_module(module)
+
+
+def loaded_backends() -> List[str]:
+    """Lists the registered backends that have already been imported."""
+    return sorted(name for name, module in BACKENDS.items() if module in sys.modules)
+
+
+def prewarm(*names: str) -> None:
+    """Imports backends ahead of time, ie. in a process pool initializer.
+
+    ``ProcessPoolExecutor(initializer=prewarm, initargs=("sqlite",))`` imports
+    the SQLite backend once per worker rather than in the first task.
+
+    :param names: Backends to import. Imports every registered backend if none
+        are given.
+    """
+    for name in names or list(BACKENDS):
+        get_backend(name)
@@ -1,8 +1,19 @@
 from decimal import Decimal
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from .constants import AXS_BREEDING_COST, SLP_BREEDING_COST
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .scenarios import (
+        BreedingResult,
+        BreedingScenario,
+        ScholarshipResult,
+        ScholarshipScenario,
+    )
+
+# Scenario records and the columnar batch helpers are imported by the methods
+# that use them, so that importing the calculators stays as cheap as possible.
+
 
 class PriceConverter(object):
     """Converts ETH, AXS, and SLP price to USD."""
@@ -173,6 +184,124 @@ class BreedingProfitCalculator(object):
             ).quantize(Decimal("0.01"))
         )
 
+    def calculate(self, scenario: "BreedingScenario") -> "BreedingResult":
+        """Calculates the breeding ROI of a scenario.
+
+        :param scenario: The breeding scenario to calculate.
+        :returns: The scenario along with every intermediate result.
+        """
+        from .scenarios import BreedingResult
+
+        return BreedingResult(scenario, *self._calculate(scenario, {}, {}))
+
+    def _calculate(
+        self,
+        scenario: "BreedingScenario",
+        breeding_costs: Dict[Tuple[int, int], Decimal],
+        sale_prices: Dict[int, Decimal],
+    ) -> Tuple[Decimal, ...]:
+        # Breeding costs and sale prices only depend on a few small integers, so
+        # batches share them across rows rather than calculating them per row.
+        key = (scenario.breed_count, scenario.parent_count)
+        if key not in breeding_costs:
+            breeding_costs[key] = self.calculate_cumulative_breeding_cost(*key)
+        if scenario.offspring_sold not in sale_prices:
+            sale_prices[scenario.offspring_sold] = self.calculate_sale_price(
+                scenario.offspring_sold
+            )
+
+        initial_capital = self.calculate_initial_capital(scenario.parent_prices)
+        breeding_cost = breeding_costs[key] - scenario.slp_farmed
+        sale_price = sale_prices[scenario.offspring_sold]
+        profit = self.calculate_profit(breeding_cost, sale_price, scenario.parents_sold)
+        roi_generations = self.calculate_roi_generations(
+            initial_capital, breeding_cost, profit
+        )
+
+        return (
+            initial_capital,
+            breeding_cost,
+            sale_price,
+            profit,
+            roi_generations,
+            self.calculate_roi_days(roi_generations=roi_generations),
+        )
+
+    def calculate_chunks(
+        self, columns: Any, chunk_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Calculates breeding ROI for a columnar batch, one chunk of rows at a time.
+
+        ``columns`` may be a mapping of column name to sequence, a NumPy
+        structured array, or an Arrow table. Each chunk is converted to Python
+        values in bulk, and memory stays bounded by ``chunk_size`` regardless of
+        the size of the batch.
+
+        Required columns are ``capital`` (ETH denominated acquisition price of all
+        parents), ``breed_count``, ``parent_count`` and ``offspring_sold``.
+        ``parents_sold`` and ``slp_farmed`` are optional and default to 0.
+
+        :param columns: A columnar batch of breeding scenarios.
+        :param chunk_size: Maximum number of rows per chunk. Defaults to
+            ``columns.CHUNK_SIZE``.
+        :returns: An iterator over slices of the input columns followed by
+            ``initial_capital``, ``breeding_cost``, ``sale_price``, ``profit``,
+            ``roi_generations`` and ``roi_days``.
+        """
+        from .columns import (
+            CHUNK_SIZE,
+            append_columns,
+            iter_chunks,
+            read_decimals,
+            read_ints,
+        )
+        from .scenarios import BreedingResult, BreedingScenario
+
+        chunk_size = chunk_size or CHUNK_SIZE
+        # Shared across chunks so that each distinct key is calculated once.
+        breeding_costs: Dict[Tuple[int, int], Decimal] = {}
+        sale_prices: Dict[int, Decimal] = {}
+
+        for chunk in iter_chunks(columns, chunk_size):
+            results: Dict[str, List[Decimal]] = {
+                name: [] for name in BreedingResult._fields[1:]
+            }
+            rows = zip(
+                read_decimals(chunk, "capital", chunk_size=chunk_size),
+                read_ints(chunk, "breed_count", chunk_size=chunk_size),
+                read_ints(chunk, "parent_count", chunk_size=chunk_size),
+                read_ints(chunk, "offspring_sold", chunk_size=chunk_size),
+                read_ints(chunk, "parents_sold", 0, chunk_size),
+                read_decimals(chunk, "slp_farmed", Decimal(0), chunk_size),
+            )
+
+            for capital, *row in rows:
+                values = self._calculate(
+                    BreedingScenario((capital,), *row), breeding_costs, sale_prices
+                )
+
+                for column, value in zip(results.values(), values):
+                    column.append(value)
+
+            yield append_columns(chunk, results)
+
+    def calculate_batch(self, columns: Any) -> Dict[str, Any]:
+        """Calculates breeding ROI for a columnar batch of scenarios.
+
+        Accepts the same columns as :meth:`calculate_chunks`, but collects every
+        chunk's results. Use :meth:`calculate_chunks` for batches too large to
+        hold the results in memory.
+
+        :param columns: A columnar batch of breeding scenarios.
+        :returns: The input columns, as-is, followed by the calculated columns.
+        """
+        from .columns import collect_chunks
+        from .scenarios import BreedingResult
+
+        return collect_chunks(
+            columns, self.calculate_chunks(columns), BreedingResult._fields[1:]
+        )
+
 
 class ScholarshipProfitCalculator(object):
     """Calculates Axie Infinity scholarship profit based on given inputs.
@@ -228,8 +357,21 @@ class ScholarshipProfitCalculator(object):
         """
         return Decimal(current_slp / days).quantize(Decimal("0.01"))
 
+    def calculate_manager_slp_per_day(self, average_slp: Decimal) -> Decimal:
+        """Calculates the manager's share of a scholar's daily SLP.
+
+        :param average_slp: Actual or potential average SLP the scholar can
+            farm per day.
+        :returns: SLP the manager earns from the scholar per day.
+        """
+        return (average_slp * self.percentage).quantize(Decimal("0.01"))
+
     def calculate_roi_periods(
-        self, initial_capital: Decimal, average_slp: Decimal, days: int
+        self,
+        initial_capital: Decimal,
+        average_slp: Decimal,
+        days: int,
+        percentage: Optional[Decimal] = None,
     ) -> Decimal:
         """Calculates the number of periods before breaking even.
 
@@ -239,9 +381,117 @@ class ScholarshipProfitCalculator(object):
             farm per day.
         :param days: Number of days in a specified period, ie. 30 if you
             want to calculate the ROI based on monthly returns.
+        :param percentage: Percentage of SLP that the manager earns from the
+            scholar, if different from the calculator's ``percentage``.
         :returns: The number of periods it will take before breaking even.
         """
+        percentage = self.percentage if percentage is None else percentage
         return Decimal(
             initial_capital
-            / (self.price_converter.slp_to_usd(average_slp) * self.percentage * days)
+            / (self.price_converter.slp_to_usd(average_slp) * percentage * days)
         ).quantize(Decimal("0.01"))
+
+    def calculate(self, scenario: "ScholarshipScenario") -> "ScholarshipResult":
+        """Calculates the scholarship ROI of a scenario.
+
+        :param scenario: The scholarship scenario to calculate.
+        :returns: The scenario along with every intermediate result.
+        """
+        from .scenarios import ScholarshipResult
+
+        initial_capital = self.calculate_initial_capital(scenario.team_price)
+        average_slp = (
+            self.potential_average_slp
+            if scenario.current_slp is None
+            else self.calculate_actual_average_slp_per_day(
+                scenario.current_slp, scenario.days
+            )
+        )
+
+        return ScholarshipResult(
+            scenario,
+            initial_capital,
+            average_slp,
+            self.calculate_roi_periods(
+                initial_capital,
+                average_slp,
+                scenario.days if scenario.period is None else scenario.period,
+                scenario.percentage,
+            ),
+        )
+
+    def calculate_chunks(
+        self, columns: Any, chunk_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Calculates scholarship ROI for a columnar batch, one chunk at a time.
+
+        ``columns`` may be a mapping of column name to sequence, a NumPy
+        structured array, or an Arrow table. Each chunk is converted to Python
+        values in bulk, and memory stays bounded by ``chunk_size`` regardless of
+        the size of the batch.
+
+        Required columns are ``team_price`` (ETH denominated acquisition price of
+        the scholar's team) and ``days``. If ``current_slp`` is given, the actual
+        average SLP is used. Otherwise, or where it is null,
+        ``potential_average_slp`` is used. ``period`` sets the length of a ROI
+        period if it differs from ``days``, and ``percentage`` overrides the
+        manager's share per scholar. Null values use the defaults.
+
+        :param columns: A columnar batch of scholarship accounts.
+        :param chunk_size: Maximum number of rows per chunk. Defaults to
+            ``columns.CHUNK_SIZE``.
+        :returns: An iterator over slices of the input columns followed by
+            ``initial_capital``, ``average_slp`` and ``roi_periods``.
+        """
+        from .columns import (
+            CHUNK_SIZE,
+            append_columns,
+            iter_chunks,
+            read_decimals,
+            read_ints,
+            read_optional_decimals,
+            read_optional_ints,
+        )
+        from .scenarios import ScholarshipResult, ScholarshipScenario
+
+        chunk_size = chunk_size or CHUNK_SIZE
+        for chunk in iter_chunks(columns, chunk_size):
+            results: Dict[str, List[Decimal]] = {
+                name: [] for name in ScholarshipResult._fields[1:]
+            }
+            rows = zip(
+                read_decimals(chunk, "team_price", chunk_size=chunk_size),
+                read_ints(chunk, "days", chunk_size=chunk_size),
+                read_optional_decimals(chunk, "current_slp", chunk_size),
+                read_optional_ints(chunk, "period", chunk_size),
+                read_optional_decimals(chunk, "percentage", chunk_size),
+            )
+
+            for team_price, days, current_slp, period, percentage in rows:
+                result = self.calculate(
+                    ScholarshipScenario(
+                        (team_price,), days, current_slp, period, percentage
+                    )
+                )
+
+                for name, column in results.items():
+                    column.append(getattr(result, name))
+
+            yield append_columns(chunk, results)
+
+    def calculate_batch(self, columns: Any) -> Dict[str, Any]:
+        """Calculates scholarship ROI for a columnar batch of accounts.
+
+        Accepts the same columns as :meth:`calculate_chunks`, but collects every
+        chunk's results. Use :meth:`calculate_chunks` for batches too large to
+        hold the results in memory.
+
+        :param columns: A columnar batch of scholarship accounts.
+        :returns: The input columns, as-is, followed by the calculated columns.
+        """
+        from .columns import collect_chunks
+        from .scenarios import ScholarshipResult
+
+        return collect_chunks(
+            columns, self.calculate_chunks(columns), ScholarshipResult._fields[1:]
+        )
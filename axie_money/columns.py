@@ -0,0 +1,216 @@
+from decimal import Decimal
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+CHUNK_SIZE = 65536
+
+
+def column_names(columns: Any) -> List[str]:
+    """List the column names of a columnar batch.
+
+    Supports plain mappings of column name to sequence, NumPy structured
+    arrays and Arrow tables without importing either library.
+
+    :param columns: A columnar batch of calculator inputs.
+    :returns: The names of every column in the batch.
+    """
+    dtype = getattr(columns, "dtype", None)
+    if dtype is not None and getattr(dtype, "names", None):
+        return list(dtype.names)
+    if hasattr(columns, "column_names"):
+        return list(columns.column_names)
+    return list(columns.keys())
+
+
+def has_column(columns: Any, name: str) -> bool:
+    """Checks whether a columnar batch contains the given column."""
+    return name in column_names(columns)
+
+
+def row_count(columns: Any) -> int:
+    """Counts the rows of a columnar batch."""
+    if hasattr(columns, "num_rows"):
+        return columns.num_rows
+    if getattr(columns, "dtype", None) is not None:
+        return len(columns)
+    return max((len(columns[name]) for name in column_names(columns)), default=0)
+
+
+def slice_column(column: Any, start: int, stop: int) -> Any:
+    """Slices a column without copying NumPy or Arrow buffers."""
+    if hasattr(column, "to_pylist"):
+        return column.slice(start, stop - start)
+    return column[start:stop]
+
+
+def to_pylist(column: Any, exact: bool = False) -> List[Any]:
+    """Converts a column, or a slice of one, to Python values in bulk.
+
+    NumPy and Arrow columns are converted by the library itself rather than one
+    scalar at a time. Arrow nulls become ``None``.
+
+    :param column: The column to convert.
+    :param exact: Whether to convert single precision floats through their
+        shortest string representation, as they would be printed, so that
+        ``0.1`` does not become its binary expansion once converted to
+        ``Decimal``.
+    :returns: The column's values.
+    """
+    if hasattr(column, "to_pylist"):
+        if exact and str(column.type) in ("float", "halffloat"):
+            column = column.cast("string")
+        return column.to_pylist()
+    if hasattr(column, "tolist"):
+        if exact and column.dtype.kind == "f" and column.dtype.itemsize < 8:
+            column = column.astype(str)
+        return column.tolist()
+    return list(column)
+
+
+def iter_chunks(columns: Any, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Splits a columnar batch into consecutive chunks of rows.
+
+    :param columns: A columnar batch of calculator inputs.
+    :param chunk_size: Maximum number of rows per chunk.
+    :returns: An iterator over mappings of column name to column slice.
+    """
+    names = column_names(columns)
+    rows = row_count(columns)
+
+    for start in range(0, rows, chunk_size):
+        stop = min(start + chunk_size, rows)
+        yield {name: slice_column(columns[name], start, stop) for name in names}
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _to_decimal(value: Any) -> Decimal:
+    return Decimal(str(value)) if isinstance(value, float) else Decimal(value)
+
+
+def _as_decimal(value: Any, default: Optional[Decimal] = None) -> Optional[Decimal]:
+    if value is None:
+        return default
+    if isinstance(value, Decimal):
+        return value
+    return _to_decimal(value)
+
+
+def _iter_values(
+    columns: Any, name: str, chunk_size: int, exact: bool = False
+) -> Iterator[Any]:
+    column = columns[name]
+    for start in range(0, len(column), chunk_size):
+        yield from to_pylist(slice_column(column, start, start + chunk_size), exact)
+
+
+def read_decimals(
+    columns: Any,
+    name: str,
+    default: Optional[Decimal] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Decimal]:
+    """Lazily reads a column as ``Decimal`` values.
+
+    Values are converted a chunk at a time, so memory does not grow with the
+    size of the column.
+
+    :param columns: A columnar batch of calculator inputs.
+    :param name: The name of the column to read.
+    :param default: Value used for null rows, or for every row if the column
+        is missing.
+    :param chunk_size: Number of values converted at a time.
+    :returns: An iterator over the column's values.
+    """
+    if default is not None and not has_column(columns, name):
+        return repeat(default)
+    return (
+        _as_decimal(value, default)
+        for value in _iter_values(columns, name, chunk_size, exact=True)
+    )
+
+
+def read_optional_decimals(
+    columns: Any, name: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Optional[Decimal]]:
+    """Lazily reads a column as ``Decimal`` values, or ``None`` if null or missing.
+
+    :param columns: A columnar batch of calculator inputs.
+    :param name: The name of the column to read.
+    :param chunk_size: Number of values converted at a time.
+    :returns: An iterator over the column's values.
+    """
+    if not has_column(columns, name):
+        return repeat(None)
+    return read_decimals(columns, name, None, chunk_size)
+
+
+def read_ints(
+    columns: Any,
+    name: str,
+    default: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[int]:
+    """Lazily reads a column as ``int`` values.
+
+    :param columns: A columnar batch of calculator inputs.
+    :param name: The name of the column to read.
+    :param default: Value used for null rows, or for every row if the column
+        is missing.
+    :param chunk_size: Number of values converted at a time.
+    :returns: An iterator over the column's values.
+    """
+    if default is not None and not has_column(columns, name):
+        return repeat(default)
+    return (
+        default if value is None else int(value)
+        for value in _iter_values(columns, name, chunk_size)
+    )
+
+
+def read_optional_ints(
+    columns: Any, name: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Optional[int]]:
+    """Lazily reads a column as ``int`` values, or ``None`` if null or missing.
+
+    :param columns: A columnar batch of calculator inputs.
+    :param name: The name of the column to read.
+    :param chunk_size: Number of values converted at a time.
+    :returns: An iterator over the column's values.
+    """
+    if not has_column(columns, name):
+        return repeat(None)
+    return read_ints(columns, name, None, chunk_size)
+
+
+def append_columns(columns: Any, results: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """Appends result columns to a batch without copying the input columns.
+
+    The input columns are referenced as-is, ie. NumPy field views or Arrow
+    chunked arrays, and the result columns are added after them.
+
+    :param columns: The columnar batch the results were calculated from.
+    :param results: Calculated columns keyed by name.
+    :returns: A mapping of every input and result column.
+    """
+    output = {name: columns[name] for name in column_names(columns)}
+    output.update(results)
+    return output
+
+
+def collect_chunks(
+    columns: Any, chunks: Iterable[Dict[str, Any]], names: Sequence[str]
+) -> Dict[str, Any]:
+    """Collects the result columns of every chunk of a batch.
+
+    :param columns: The columnar batch the chunks were calculated from.
+    :param chunks: Calculated chunks, ie. from ``calculate_chunks``.
+    :param names: Names of the result columns to collect.
+    :returns: The input columns, as-is, followed by the collected columns.
+    """
+    results: Dict[str, List[Any]] = {name: [] for name in names}
+    for chunk in chunks:
+        for name, column in results.items():
+            column.extend(chunk[name])
+
+    return append_columns(columns, results)
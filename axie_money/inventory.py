@@ -0,0 +1,148 @@
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List
+
+from .calculators import BreedingProfitCalculator, PriceConverter
+from .columns import (
+    CHUNK_SIZE,
+    append_columns,
+    collect_chunks,
+    iter_chunks,
+    read_decimals,
+    read_ints,
+)
+from .constants import AXS_BREEDING_COST, SLP_BREEDING_COST
+from .scenarios import FarmResult, FarmScenario, InventoryBalance
+
+# Every result except the scenario and the recorded daily balances.
+RESULT_COLUMNS = FarmResult._fields[1:-1]
+
+
+class InventoryCostEngine(object):
+    """Simulates breeding costs paid from SLP, AXS and ETH holdings.
+
+    Unlike ``calculate_cumulative_breeding_cost``, which deducts farmed SLP as a
+    single USD amount, this tracks holdings day by day. Scholars' SLP arrives
+    daily, and a generation is bred every ``days_per_generation`` days.
+
+    Each fee is paid from SLP or AXS stock first. Any shortfall is bought with
+    ETH holdings, and with USD once ETH runs out. All conversions use the
+    calculator's ``PriceConverter`` rates, so using stock first never costs more
+    than buying.
+
+    :attribute calculator: Calculator providing prices and breeding costs.
+    :attribute days_per_generation: Days between bred generations.
+    """
+
+    def __init__(
+        self, calculator: BreedingProfitCalculator, days_per_generation: int = 5
+    ):
+        self.calculator = calculator
+        self.days_per_generation = days_per_generation
+
+    @property
+    def price_converter(self) -> PriceConverter:
+        """Converter used for buying SLP and AXS with ETH or USD."""
+        return self.calculator.price_converter
+
+    def simulate(self, scenario: FarmScenario, record: bool = False) -> FarmResult:
+        """Simulates paying the breeding fees of a farm.
+
+        :param scenario: The farm's breeding loop, SLP income and holdings.
+        :param record: Whether to keep the holdings at the end of every day.
+        :returns: The costs, stock used and final holdings of the farm.
+        """
+        converter = self.price_converter
+        slp, axs, eth = scenario.slp_stock, scenario.axs_stock, scenario.eth_stock
+        breeding_cost = usd_spent = slp_used = axs_used = Decimal(0)
+        balances = []
+
+        for day in range(scenario.breed_count * self.days_per_generation):
+            generation, offset = divmod(day, self.days_per_generation)
+            if offset == 0:
+                breeding_cost += self.calculator.calculate_breeding_cost(
+                    [generation] * scenario.parent_count
+                )
+
+                slp_fee = SLP_BREEDING_COST[generation] * scenario.parent_count
+                axs_fee = AXS_BREEDING_COST * scenario.parent_count
+                slp_paid, axs_paid = min(slp, slp_fee), min(axs, axs_fee)
+                slp, axs = slp - slp_paid, axs - axs_paid
+                slp_used += slp_paid
+                axs_used += axs_paid
+
+                # Rounded per generation, like ``calculate_breeding_cost``.
+                shortfall = (
+                    converter.slp_to_usd(slp_fee - slp_paid)
+                    + converter.axs_to_usd(axs_fee - axs_paid)
+                ).quantize(Decimal("0.01"))
+                eth_paid = min(eth, shortfall / converter.eth_rate)
+                eth -= eth_paid
+                usd_spent += (shortfall - converter.eth_to_usd(eth_paid)).quantize(
+                    Decimal("0.01")
+                )
+
+            slp += scenario.daily_slp
+            if record:
+                balances.append(InventoryBalance(day, slp, axs, eth))
+
+        return FarmResult(
+            scenario,
+            breeding_cost,
+            usd_spent,
+            slp_used,
+            axs_used,
+            scenario.eth_stock - eth,
+            slp,
+            axs,
+            eth,
+            tuple(balances),
+        )
+
+    def simulate_chunks(
+        self, columns: Any, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """Simulates a columnar batch of farms, one chunk of rows at a time.
+
+        ``columns`` may be a mapping of column name to sequence, a NumPy
+        structured array, or an Arrow table, as in ``calculate_chunks``.
+
+        Required columns are ``breed_count`` and ``parent_count``. ``daily_slp``,
+        ``slp_stock``, ``axs_stock`` and ``eth_stock`` are optional and default
+        to 0.
+
+        :param columns: A columnar batch of farm scenarios.
+        :param chunk_size: Maximum number of rows per chunk.
+        :returns: An iterator over slices of the input columns followed by
+            ``breeding_cost``, ``usd_spent``, ``slp_used``, ``axs_used``,
+            ``eth_spent``, ``slp_balance``, ``axs_balance`` and ``eth_balance``.
+        """
+        for chunk in iter_chunks(columns, chunk_size):
+            results: Dict[str, List[Decimal]] = {name: [] for name in RESULT_COLUMNS}
+            rows = zip(
+                read_ints(chunk, "breed_count", chunk_size=chunk_size),
+                read_ints(chunk, "parent_count", chunk_size=chunk_size),
+                read_decimals(chunk, "daily_slp", Decimal(0), chunk_size),
+                read_decimals(chunk, "slp_stock", Decimal(0), chunk_size),
+                read_decimals(chunk, "axs_stock", Decimal(0), chunk_size),
+                read_decimals(chunk, "eth_stock", Decimal(0), chunk_size),
+            )
+
+            for row in rows:
+                result = self.simulate(FarmScenario(*row))
+
+                for name, column in results.items():
+                    column.append(getattr(result, name))
+
+            yield append_columns(chunk, results)
+
+    def simulate_batch(self, columns: Any) -> Dict[str, Any]:
+        """Simulates a columnar batch of farms.
+
+        Accepts the same columns as :meth:`simulate_chunks`, but collects every
+        chunk's results. Use :meth:`simulate_chunks` for batches too large to
+        hold the results in memory.
+
+        :param columns: A columnar batch of farm scenarios.
+        :returns: The input columns, as-is, followed by the simulated columns.
+        """
+        return collect_chunks(columns, self.simulate_chunks(columns), RESULT_COLUMNS)
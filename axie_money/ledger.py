@@ -0,0 +1,243 @@
+import datetime
+import sqlite3
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .calculators import PriceConverter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    purchase_price TEXT NOT NULL,
+    purchased_on TEXT
+);
+CREATE TABLE IF NOT EXISTS scholars (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    team_id INTEGER NOT NULL REFERENCES teams (id),
+    percentage TEXT
+);
+CREATE TABLE IF NOT EXISTS daily_slp (
+    scholar_id INTEGER NOT NULL REFERENCES scholars (id),
+    date TEXT NOT NULL,
+    slp INTEGER NOT NULL,
+    PRIMARY KEY (scholar_id, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS daily_slp_date ON daily_slp (date, scholar_id);
+CREATE TABLE IF NOT EXISTS breeding_events (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    capital TEXT NOT NULL,
+    breed_count INTEGER NOT NULL,
+    parent_count INTEGER NOT NULL,
+    offspring_sold INTEGER NOT NULL,
+    parents_sold INTEGER NOT NULL DEFAULT 0,
+    slp_farmed TEXT NOT NULL DEFAULT '0'
+);
+CREATE INDEX IF NOT EXISTS breeding_events_date ON breeding_events (date);
+CREATE TABLE IF NOT EXISTS price_snapshots (
+    date TEXT PRIMARY KEY,
+    eth_rate TEXT NOT NULL,
+    axs_rate TEXT NOT NULL,
+    slp_rate TEXT NOT NULL
+);
+"""
+
+
+class Ledger(object):
+    """Embedded SQLite ledger of a fleet of scholars and breeding loops.
+
+    Decimal amounts are stored as text so that they round trip exactly. Dates
+    are stored as ISO 8601 text and may be given as strings or ``date`` objects.
+
+    :attribute connection: The underlying SQLite connection.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Closes the underlying connection."""
+        self.connection.close()
+
+    def _insert(
+        self, table: str, names: Sequence[str], rows: Iterable[Sequence]
+    ) -> None:
+        query = "INSERT INTO {} ({}) VALUES ({})".format(
+            table, ", ".join(names), ", ".join("?" * len(names))
+        )
+        with self.connection:
+            self.connection.executemany(query, (_adapt(row) for row in rows))
+
+    def add_teams(self, rows: Iterable[Sequence]) -> None:
+        """Inserts teams in a single transaction.
+
+        :param rows: ``(id, name, purchase_price, purchased_on)`` tuples, where
+            ``purchase_price`` is the ETH denominated price of the whole team.
+        """
+        self._insert("teams", ("id", "name", "purchase_price", "purchased_on"), rows)
+
+    def add_scholars(self, rows: Iterable[Sequence]) -> None:
+        """Inserts scholars in a single transaction.
+
+        :param rows: ``(id, name, team_id, percentage)`` tuples, where
+            ``percentage`` is the manager's share of the scholar's SLP, or
+            ``None`` to use the calculator's percentage.
+        """
+        self._insert("scholars", ("id", "name", "team_id", "percentage"), rows)
+
+    def add_daily_slp(self, rows: Iterable[Sequence]) -> None:
+        """Inserts daily SLP earnings in a single transaction.
+
+        :param rows: ``(scholar_id, date, slp)`` tuples.
+        """
+        self._insert("daily_slp", ("scholar_id", "date", "slp"), rows)
+
+    def add_breeding_events(self, rows: Iterable[Sequence]) -> None:
+        """Inserts breeding events in a single transaction.
+
+        :param rows: ``(date, capital, breed_count, parent_count, offspring_sold,
+            parents_sold, slp_farmed)`` tuples, following the columns of
+            :meth:`BreedingProfitCalculator.calculate_batch`.
+        """
+        self._insert(
+            "breeding_events",
+            (
+                "date",
+                "capital",
+                "breed_count",
+                "parent_count",
+                "offspring_sold",
+                "parents_sold",
+                "slp_farmed",
+            ),
+            rows,
+        )
+
+    def add_price_snapshots(self, rows: Iterable[Sequence]) -> None:
+        """Inserts price snapshots in a single transaction.
+
+        :param rows: ``(date, eth_rate, axs_rate, slp_rate)`` tuples.
+        """
+        self._insert(
+            "price_snapshots", ("date", "eth_rate", "axs_rate", "slp_rate"), rows
+        )
+
+    def price_converter(self, on: Any) -> PriceConverter:
+        """Builds a price converter from the latest snapshot up to a date.
+
+        :param on: The date to price at.
+        :returns: A converter using the rates of the latest snapshot.
+        """
+        row = self.connection.execute(
+            "SELECT eth_rate, axs_rate, slp_rate FROM price_snapshots"
+            " WHERE date <= ? ORDER BY date DESC LIMIT 1",
+            (_adapt_value(on),),
+        ).fetchone()
+        if row is None:
+            raise LookupError("No price snapshot on or before {}.".format(on))
+
+        eth_rate, axs_rate, slp_rate = (Decimal(rate) for rate in row)
+        return PriceConverter(eth_rate=eth_rate, axs_rate=axs_rate, slp_rate=slp_rate)
+
+    def slp_history(
+        self, scholar_id: int, start: Optional[Any] = None, end: Optional[Any] = None
+    ) -> Dict[str, List[Any]]:
+        """Queries a scholar's daily SLP earnings as columns.
+
+        :param scholar_id: The scholar to query.
+        :param start: Earliest date to include, if any.
+        :param end: Latest date to include, if any.
+        :returns: ``date`` and ``slp`` columns, ordered by date.
+        """
+        query = "SELECT date, slp FROM daily_slp WHERE scholar_id = ?"
+        parameters = [scholar_id]
+        if start is not None:
+            query += " AND date >= ?"
+            parameters.append(_adapt_value(start))
+        if end is not None:
+            query += " AND date <= ?"
+            parameters.append(_adapt_value(end))
+
+        cursor = self.connection.execute(query + " ORDER BY date", parameters)
+        return _columns(cursor)
+
+    def scholarship_columns(
+        self, start: Any, end: Any, period: int = 30
+    ) -> Dict[str, List[Any]]:
+        """Queries every scholar's earnings within a date range as columns.
+
+        The result can be passed directly to
+        :meth:`ScholarshipProfitCalculator.calculate_batch`. ``days`` is the
+        number of days with recorded earnings, used to average ``current_slp``,
+        while every scholar's ROI is calculated over the same ``period``.
+
+        :param start: Earliest date to include.
+        :param end: Latest date to include.
+        :param period: Number of days in a ROI period, ie. 30 for monthly returns.
+        :returns: ``scholar_id``, ``team_price``, ``percentage``, ``days``,
+            ``period`` and ``current_slp`` columns, ordered by scholar.
+        """
+        cursor = self.connection.execute(
+            "SELECT s.id AS scholar_id, t.purchase_price AS team_price,"
+            " s.percentage AS percentage, count(d.date) AS days,"
+            " ? AS period, sum(d.slp) AS current_slp"
+            " FROM daily_slp AS d"
+            " JOIN scholars AS s ON s.id = d.scholar_id"
+            " JOIN teams AS t ON t.id = s.team_id"
+            " WHERE d.date BETWEEN ? AND ?"
+            " GROUP BY s.id ORDER BY s.id",
+            (period, _adapt_value(start), _adapt_value(end)),
+        )
+        return _columns(cursor, decimals=("team_price", "percentage"))
+
+    def breeding_columns(self, start: Any, end: Any) -> Dict[str, List[Any]]:
+        """Queries breeding events within a date range as columns.
+
+        The result can be passed directly to
+        :meth:`BreedingProfitCalculator.calculate_batch`.
+
+        :param start: Earliest date to include.
+        :param end: Latest date to include.
+        :returns: ``id``, ``date``, ``capital``, ``breed_count``,
+            ``parent_count``, ``offspring_sold``, ``parents_sold`` and
+            ``slp_farmed`` columns, ordered by date.
+        """
+        cursor = self.connection.execute(
+            "SELECT id, date, capital, breed_count, parent_count, offspring_sold,"
+            " parents_sold, slp_farmed FROM breeding_events"
+            " WHERE date BETWEEN ? AND ? ORDER BY date, id",
+            (_adapt_value(start), _adapt_value(end)),
+        )
+        return _columns(cursor, decimals=("capital", "slp_farmed"))
+
+
+def _adapt_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def _adapt(row: Sequence) -> List[Any]:
+    return [_adapt_value(value) for value in row]
+
+
+def _columns(
+    cursor: sqlite3.Cursor, decimals: Sequence[str] = ()
+) -> Dict[str, List[Any]]:
+    names = [description[0] for description in cursor.description]
+    columns: Dict[str, List[Any]] = {name: [] for name in names}
+    appends = [
+        (columns[name].append, Decimal if name in decimals else None) for name in names
+    ]
+
+    for row in cursor:
+        for (append, convert), value in zip(appends, row):
+            append(convert(value) if convert and value is not None else value)
+
+    return columns
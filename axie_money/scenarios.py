@@ -0,0 +1,120 @@
+from decimal import Decimal
+from typing import NamedTuple, Optional, Tuple
+
+
+class BreedingScenario(NamedTuple):
+    """Inputs of a single breeding ROI calculation.
+
+    Scenarios are immutable and hashable so that they can be used as cache keys
+    and sent across process pools.
+
+    :attribute parent_prices: ETH denominated acquisition price of all parents.
+    :attribute breed_count: The target breed count for all parents.
+    :attribute parent_count: The number of parents used for breeding a generation.
+    :attribute offspring_sold: Amount of axies sold.
+    :attribute parents_sold: Amount of parents sold.
+    :attribute slp_farmed: USD value of farmed SLP used for paying breeding costs.
+    """
+
+    parent_prices: Tuple[Decimal, ...]
+    breed_count: int
+    parent_count: int
+    offspring_sold: int
+    parents_sold: int = 0
+    slp_farmed: Decimal = Decimal(0)
+
+
+class BreedingResult(NamedTuple):
+    """Outputs and intermediates of a breeding ROI calculation."""
+
+    scenario: BreedingScenario
+    initial_capital: Decimal
+    breeding_cost: Decimal
+    sale_price: Decimal
+    profit: Decimal
+    roi_generations: Decimal
+    roi_days: Decimal
+
+
+class ScholarshipScenario(NamedTuple):
+    """Inputs of a single scholarship ROI calculation.
+
+    :attribute team_price: ETH denominated acquisition price of the scholar's
+        team of axies.
+    :attribute days: Number of days the scholar farmed ``current_slp`` in. Also
+        used as the ROI period if ``period`` is not given.
+    :attribute current_slp: Unclaimable SLP the scholar farmed in ``days``. If
+        not given, the calculator's potential average SLP is used.
+    :attribute period: Number of days in a ROI period, ie. 30 for monthly
+        returns.
+    :attribute percentage: Percentage of SLP that the manager earns from this
+        scholar. If not given, the calculator's percentage is used.
+    """
+
+    team_price: Tuple[Decimal, ...]
+    days: int
+    current_slp: Optional[Decimal] = None
+    period: Optional[int] = None
+    percentage: Optional[Decimal] = None
+
+
+class ScholarshipResult(NamedTuple):
+    """Outputs and intermediates of a scholarship ROI calculation."""
+
+    scenario: ScholarshipScenario
+    initial_capital: Decimal
+    average_slp: Decimal
+    roi_periods: Decimal
+
+
+class FarmScenario(NamedTuple):
+    """Inputs of an inventory-aware breeding cost simulation.
+
+    :attribute breed_count: The target breed count for all parents.
+    :attribute parent_count: The number of parents used for breeding a generation.
+    :attribute daily_slp: SLP the manager receives from scholars per day.
+    :attribute slp_stock: SLP held at the start of the simulation.
+    :attribute axs_stock: AXS held at the start of the simulation.
+    :attribute eth_stock: ETH held at the start of the simulation, used to buy
+        missing SLP and AXS before spending USD.
+    """
+
+    breed_count: int
+    parent_count: int
+    daily_slp: Decimal = Decimal(0)
+    slp_stock: Decimal = Decimal(0)
+    axs_stock: Decimal = Decimal(0)
+    eth_stock: Decimal = Decimal(0)
+
+
+class InventoryBalance(NamedTuple):
+    """SLP, AXS and ETH held at the end of a simulated day."""
+
+    day: int
+    slp: Decimal
+    axs: Decimal
+    eth: Decimal
+
+
+class FarmResult(NamedTuple):
+    """Outputs of an inventory-aware breeding cost simulation.
+
+    :attribute breeding_cost: USD value of every breeding fee, regardless of
+        how it was paid.
+    :attribute usd_spent: USD spent buying SLP and AXS not covered by stock.
+    :attribute slp_used: SLP paid from stock.
+    :attribute axs_used: AXS paid from stock.
+    :attribute eth_spent: ETH sold to buy SLP and AXS not covered by stock.
+    :attribute balances: Holdings at the end of each day, if recorded.
+    """
+
+    scenario: FarmScenario
+    breeding_cost: Decimal
+    usd_spent: Decimal
+    slp_used: Decimal
+    axs_used: Decimal
+    eth_spent: Decimal
+    slp_balance: Decimal
+    axs_balance: Decimal
+    eth_balance: Decimal
+    balances: Tuple[InventoryBalance, ...] = ()
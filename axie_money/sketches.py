@@ -0,0 +1,264 @@
+import math
+import random
+from decimal import Decimal
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+Number = Union[Decimal, float, int]
+
+
+class Moments(object):
+    """Streaming count, mean, variance, minimum and maximum.
+
+    Uses Welford's algorithm for updates and Chan's formula for merging, so
+    moments computed by separate workers can be combined without keeping the
+    underlying values.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the observed values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation of the observed values."""
+        return math.sqrt(self.variance)
+
+    def update(self, value: Number) -> None:
+        """Adds a value to the moments.
+
+        :param value: The observed value, ie. the result of ``calculate_roi_days``.
+        """
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Moments") -> "Moments":
+        """Merges the moments of another stream into this one.
+
+        :param other: Moments computed over a separate stream of values.
+        :returns: This instance, updated in place.
+        """
+        if other.count == 0:
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+
+class QuantileSketch(object):
+    """Mergeable KLL quantile sketch.
+
+    Keeps a bounded number of values regardless of how many are observed. The
+    rank error is roughly ``1.7 / k``, ie. about 1% with the default ``k``.
+
+    :attribute k: Capacity of the top level compactor, trading memory for
+        accuracy.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.count = 0
+        self.compactors: List[List[float]] = [[]]
+        self.size = 0
+        self.max_size = self._capacity(0)
+        self._random = random.Random(seed)
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.compactors) - height - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def _grow(self) -> None:
+        self.compactors.append([])
+        self.max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def _compress(self) -> None:
+        for height, compactor in enumerate(self.compactors):
+            if len(compactor) < self._capacity(height):
+                continue
+            if height + 1 >= len(self.compactors):
+                self._grow()
+
+            compactor.sort()
+            # An odd item out stays at this level so that total weight is kept.
+            kept = [compactor.pop()] if len(compactor) % 2 else []
+            offset = self._random.randint(0, 1)
+            self.compactors[height + 1].extend(compactor[offset::2])
+            self.compactors[height] = kept
+            self.size = sum(len(c) for c in self.compactors)
+
+            if self.size < self.max_size:
+                break
+
+    def update(self, value: Number) -> None:
+        """Adds a value to the sketch.
+
+        :param value: The observed value, ie. the result of ``calculate_roi_days``.
+        """
+        self.compactors[0].append(float(value))
+        self.count += 1
+        self.size += 1
+
+        if self.size >= self.max_size:
+            self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Merges another sketch into this one.
+
+        :param other: A sketch computed over a separate stream of values.
+        :returns: This instance, updated in place.
+        """
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for height, compactor in enumerate(other.compactors):
+            self.compactors[height].extend(compactor)
+
+        self.count += other.count
+        self.size = sum(len(c) for c in self.compactors)
+        while self.size >= self.max_size:
+            self._compress()
+        return self
+
+    def _weighted(self) -> List[Tuple[float, int]]:
+        return sorted(
+            (value, 2 ** height)
+            for height, compactor in enumerate(self.compactors)
+            for value in compactor
+        )
+
+    def rank(self, value: Number) -> int:
+        """Estimates the amount of observed values less than or equal to ``value``."""
+        value = float(value)
+        return sum(
+            2 ** height
+            for height, compactor in enumerate(self.compactors)
+            for item in compactor
+            if item <= value
+        )
+
+    def quantiles(self, fractions: Iterable[float]) -> List[float]:
+        """Estimates the values at the given fractions of the distribution.
+
+        :param fractions: Numbers between 0-1, ie. 0.5 for the median.
+        :returns: The estimated value for each fraction.
+        """
+        weighted = self._weighted()
+        if not weighted:
+            raise ValueError("Cannot compute quantiles of an empty sketch.")
+
+        total = sum(weight for _, weight in weighted)
+        results = []
+        for fraction in fractions:
+            target = fraction * total
+            cumulative = 0
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    break
+            results.append(value)
+        return results
+
+    def quantile(self, fraction: float) -> float:
+        """Estimates the value at the given fraction of the distribution."""
+        return self.quantiles([fraction])[0]
+
+    def histogram(self, edges: List[Number]) -> List[int]:
+        """Estimates the amount of values between consecutive bin edges.
+
+        :param edges: Ascending bin edges. Bins are closed on the right.
+        :returns: The estimated count for each of the ``len(edges) - 1`` bins.
+        """
+        ranks = [self.rank(edge) for edge in edges]
+        return [upper - lower for lower, upper in zip(ranks, ranks[1:])]
+
+
+class Summary(object):
+    """Fixed memory distribution summary of a stream of values.
+
+    Combines :class:`Moments` and :class:`QuantileSketch`. Summaries can be
+    updated in worker processes, pickled, and merged by the parent.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.moments = Moments()
+        self.sketch = QuantileSketch(k, seed)
+
+    @property
+    def count(self) -> int:
+        """Amount of observed values."""
+        return self.moments.count
+
+    def update(self, value: Number) -> None:
+        """Adds a value to the summary."""
+        self.moments.update(value)
+        self.sketch.update(value)
+
+    def update_many(self, values: Iterable[Number]) -> None:
+        """Adds every value of an iterable to the summary."""
+        for value in values:
+            self.update(value)
+
+    def merge(self, other: "Summary") -> "Summary":
+        """Merges another summary into this one.
+
+        :param other: A summary computed over a separate stream of values.
+        :returns: This instance, updated in place.
+        """
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def percentiles(self, percents: Iterable[Number]) -> List[float]:
+        """Estimates the values at the given percentiles, ie. 50 for the median."""
+        return self.sketch.quantiles(float(percent) / 100 for percent in percents)
+
+
+class GroupedSummary(object):
+    """Summaries of a stream of values keyed by group.
+
+    :attribute groups: A summary for each observed group.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.seed = seed
+        self.groups: Dict[Hashable, Summary] = {}
+
+    def __getitem__(self, group: Hashable) -> Summary:
+        return self.groups[group]
+
+    def _summary(self, group: Hashable) -> Summary:
+        if group not in self.groups:
+            self.groups[group] = Summary(self.k, self.seed)
+        return self.groups[group]
+
+    def update(self, group: Hashable, value: Number) -> None:
+        """Adds a value to the summary of the given group."""
+        self._summary(group).update(value)
+
+    def merge(self, other: "GroupedSummary") -> "GroupedSummary":
+        """Merges the summaries of another grouped summary into this one.
+
+        :param other: Grouped summaries computed over a separate stream of values.
+        :returns: This instance, updated in place.
+        """
+        for group, summary in other.groups.items():
+            self._summary(group).merge(summary)
+        return self
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+
+import pytest
+
+from axie_money import backends
+
+LAZY_MODULES = [
+    "asyncio",
+    "axie_money.columns",
+    "axie_money.inventory",
+    "axie_money.ledger",
+    "axie_money.scenarios",
+    "axie_money.sketches",
+    "numpy",
+    "random",
+    "sqlite3",
+]
+
+
+def run(code, *options):
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+class TestBackends(object):
+    def test_import_is_lazy(self):
+        output = run(
+            "import sys, axie_money.calculators, axie_money.backends;"
+            "print(*[m for m in {!r} if m in sys.modules])".format(LAZY_MODULES)
+        )
+
+        assert output.stdout.split() == []
+
+    def test_import_time(self):
+        # Regression benchmark: the cumulative import time of the calculators,
+        # relative to ``decimal`` and ``typing`` imported in the same process.
+        # This is about 0.3 for the pure Decimal calculators, so the budget
+        # catches eager imports of the batch helpers or any backend.
+        ratios = []
+        for _ in range(5):
+            output = run(
+                "import decimal, typing, axie_money.calculators", "-X", "importtime"
+            )
+            fields = [line.split("|") for line in output.stderr.splitlines()]
+            cumulative = {
+                name.strip(): int(time)
+                for _, time, name in fields
+                if time.strip().isdigit() and not name.startswith("  ")
+            }
+            ratios.append(
+                cumulative["axie_money.calculators"]
+                / (cumulative["decimal"] + cumulative["typing"])
+            )
+
+        assert min(ratios) < 0.45
+
+    def test_prewarm(self):
+        output = run(
+            "from axie_money import backends;"
+            "backends.prewarm('sqlite');"
+            "print(*backends.loaded_backends())"
+        )
+
+        assert output.stdout.split() == ["sqlite"]
+
+    def test_get_backend(self):
+        assert backends.get_backend("sqlite").Ledger
+
+    def test_get_unknown_backend(self):
+        with pytest.raises(LookupError):
+            backends.get_backend("no-such-backend")
+
+    def test_register_backend(self, monkeypatch):
+        monkeypatch.setattr(backends, "BACKENDS", dict(backends.BACKENDS))
+        backends.register_backend("quantiles", "axie_money.sketches")
+
+        assert backends.get_backend("quantiles").QuantileSketch
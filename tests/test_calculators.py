@@ -1,10 +1,14 @@
+import pickle
 from decimal import Decimal
 
+import pytest
+
 from axie_money.calculators import (
     BreedingProfitCalculator,
     PriceConverter,
     ScholarshipProfitCalculator,
 )
+from axie_money.scenarios import BreedingResult, BreedingScenario, ScholarshipScenario
 
 
 class TestPriceConverter(object):
@@ -478,6 +482,132 @@ class TestBreedingProfitCalculatorABCDLoop(object):
             initial_capital=initial_capital, breeding_cost=breeding_cost, profit=profit
         ) == Decimal("6.45")
 
+    def test_calculate(self):
+        scenario = BreedingScenario(
+            parent_prices=(Decimal("0.5"),) * 4,
+            breed_count=4,
+            parent_count=4,
+            offspring_sold=4,
+            parents_sold=4,
+        )
+        result = self.calculator.calculate(scenario)
+
+        assert result.scenario is scenario
+        assert result.initial_capital == Decimal("6280")
+        assert result.roi_generations == Decimal("1.29")
+        assert result.roi_days == Decimal("6.45")
+
+    def test_scenario_hash_and_pickle(self):
+        scenario = BreedingScenario((Decimal("0.5"),) * 4, 4, 4, 4)
+        result = self.calculator.calculate(scenario)
+
+        assert {scenario: result}[BreedingScenario((Decimal("0.5"),) * 4, 4, 4, 4)]
+        assert pickle.loads(pickle.dumps(result)) == result
+
+    def test_calculate_batch(self):
+        columns = {
+            "capital": [Decimal("2"), Decimal("2")],
+            "breed_count": [4, 4],
+            "parent_count": [4, 4],
+            "offspring_sold": [4, 4],
+            "parents_sold": [0, 4],
+        }
+        results = self.calculator.calculate_batch(columns)
+
+        assert results["capital"] is columns["capital"]
+        assert results["initial_capital"] == [Decimal("6280")] * 2
+        assert results["roi_days"] == [Decimal("10.15"), Decimal("6.45")]
+
+    def test_calculate_batch_slp_farmed(self):
+        slp_farmed = self.calculator.price_converter.slp_to_usd(500)
+        results = self.calculator.calculate_batch(
+            {
+                "capital": [2.0],
+                "breed_count": [4],
+                "parent_count": [4],
+                "offspring_sold": [4],
+                "slp_farmed": [slp_farmed],
+            }
+        )
+
+        assert results["roi_days"] == [Decimal("10")]
+
+    def test_calculate_chunks(self):
+        columns = {
+            "capital": [Decimal("2"), Decimal("2"), Decimal("2")],
+            "breed_count": [4, 4, 4],
+            "parent_count": [4, 4, 4],
+            "offspring_sold": [4, 4, 4],
+            "parents_sold": [0, 4, 0],
+        }
+        chunks = list(self.calculator.calculate_chunks(columns, chunk_size=2))
+
+        assert [chunk["parents_sold"] for chunk in chunks] == [[0, 4], [0]]
+        assert [chunk["roi_days"] for chunk in chunks] == [
+            [Decimal("10.15"), Decimal("6.45")],
+            [Decimal("10.15")],
+        ]
+
+    def test_calculate_batch_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        columns = numpy.zeros(
+            2,
+            dtype=[
+                ("capital", "f4"),
+                ("breed_count", "i8"),
+                ("parent_count", "i8"),
+                ("offspring_sold", "i8"),
+            ],
+        )
+        columns["capital"] = [0.1, 2]
+        columns["breed_count"] = columns["parent_count"] = 4
+        columns["offspring_sold"] = 4
+        results = self.calculator.calculate_batch(columns)
+
+        assert results["initial_capital"] == [Decimal("314.0"), Decimal("6280")]
+        assert results["roi_days"][1] == Decimal("10.15")
+
+    def test_calculate_batch_numpy_float32_counts(self):
+        numpy = pytest.importorskip("numpy")
+        columns = numpy.zeros(
+            1,
+            dtype=[
+                ("capital", "f8"),
+                ("breed_count", "f4"),
+                ("parent_count", "f4"),
+                ("offspring_sold", "f4"),
+            ],
+        )
+        columns["capital"] = 2
+        columns["breed_count"] = columns["parent_count"] = 4
+        columns["offspring_sold"] = 4
+        results = self.calculator.calculate_batch(columns)
+
+        assert results["roi_days"] == [Decimal("10.15")]
+
+    def test_calculate_batch_matches_calculate(self):
+        columns = {
+            "capital": [Decimal("2"), Decimal("1.5")],
+            "breed_count": [4, 2],
+            "parent_count": [4, 2],
+            "offspring_sold": [4, 2],
+            "slp_farmed": [Decimal("40"), Decimal("0")],
+        }
+        results = self.calculator.calculate_batch(columns)
+
+        for row in range(2):
+            result = self.calculator.calculate(
+                BreedingScenario(
+                    (columns["capital"][row],),
+                    columns["breed_count"][row],
+                    columns["parent_count"][row],
+                    columns["offspring_sold"][row],
+                    slp_farmed=columns["slp_farmed"][row],
+                )
+            )
+            for name in BreedingResult._fields[1:]:
+                assert results[name][row] == getattr(result, name)
+
 
 class TestScholarshipProfitCalculator(object):
     calculator = ScholarshipProfitCalculator(
@@ -502,6 +632,14 @@ class TestScholarshipProfitCalculator(object):
             current_slp=2000, days=15
         ) == Decimal("133.33")
 
+    def test_calculate_manager_slp_per_day(self):
+        assert self.calculator.calculate_manager_slp_per_day(
+            self.calculator.potential_average_slp
+        ) == Decimal("62.5")
+        assert self.calculator.calculate_manager_slp_per_day(
+            Decimal("133.33")
+        ) == Decimal("66.66")
+
     def test_calculate_roi_periods_potential(self):
         initial_capital = self.calculator.calculate_initial_capital(
             [Decimal("0.18"), Decimal("0.22"), Decimal("0.169")]
@@ -525,3 +663,70 @@ class TestScholarshipProfitCalculator(object):
         assert self.calculator.calculate_roi_periods(
             initial_capital, actual_average, days
         ) == Decimal("7.44")
+
+    def test_calculate(self):
+        result = self.calculator.calculate(
+            ScholarshipScenario(
+                team_price=(Decimal("0.18"), Decimal("0.22"), Decimal("0.169")),
+                days=30,
+                current_slp=Decimal("6000"),
+            )
+        )
+
+        assert result.initial_capital == Decimal("1786.66")
+        assert result.average_slp == Decimal("200")
+        assert result.roi_periods == Decimal("7.44")
+
+    def test_calculate_potential(self):
+        result = self.calculator.calculate(ScholarshipScenario((Decimal("0.569"),), 30))
+
+        assert result.average_slp == Decimal("125")
+        assert result.roi_periods == Decimal("11.91")
+
+    def test_calculate_period_and_percentage(self):
+        result = self.calculator.calculate(
+            ScholarshipScenario(
+                team_price=(Decimal("0.569"),),
+                days=10,
+                current_slp=Decimal("2000"),
+                period=30,
+                percentage=Decimal("0.25"),
+            )
+        )
+
+        assert result.average_slp == Decimal("200")
+        assert result.roi_periods == Decimal("14.89")
+
+    def test_calculate_batch(self):
+        columns = {
+            "team_price": [Decimal("0.569"), Decimal("0.569")],
+            "days": [30, 30],
+            "current_slp": [Decimal("3750"), Decimal("6000")],
+        }
+        results = self.calculator.calculate_batch(columns)
+
+        assert results["team_price"] is columns["team_price"]
+        assert results["initial_capital"] == [Decimal("1786.66")] * 2
+        assert results["average_slp"] == [Decimal("125"), Decimal("200")]
+        assert results["roi_periods"] == [Decimal("11.91"), Decimal("7.44")]
+
+    def test_calculate_batch_potential(self):
+        results = self.calculator.calculate_batch({"team_price": [0.569], "days": [30]})
+
+        assert results["average_slp"] == [Decimal("125")]
+        assert results["roi_periods"] == [Decimal("11.91")]
+
+    def test_calculate_batch_arrow_nulls(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        columns = pyarrow.table(
+            {
+                "team_price": pyarrow.array([0.569, 0.569], pyarrow.float32()),
+                "days": [30, 30],
+                "current_slp": [None, 6000],
+            }
+        )
+        results = self.calculator.calculate_batch(columns)
+
+        assert results["team_price"].equals(columns["team_price"])
+        assert results["average_slp"] == [Decimal("125"), Decimal("200")]
+        assert results["roi_periods"] == [Decimal("11.91"), Decimal("7.44")]
@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import pytest
+
+from axie_money.columns import iter_chunks, read_decimals, read_ints
+
+
+class TestColumns(object):
+    def test_read_decimals(self):
+        columns = {"price": [0.1, Decimal("0.50"), "2", 3, None]}
+
+        assert list(read_decimals(columns, "price", Decimal(0), chunk_size=2)) == [
+            Decimal("0.1"),
+            Decimal("0.50"),
+            Decimal("2"),
+            Decimal("3"),
+            Decimal("0"),
+        ]
+
+    def test_read_missing_column(self):
+        reader = read_ints({"price": [1, 2]}, "parents_sold", 0)
+
+        assert [next(reader), next(reader)] == [0, 0]
+
+    def test_iter_chunks(self):
+        chunks = list(iter_chunks({"a": [1, 2, 3], "b": [4, 5, 6]}, chunk_size=2))
+
+        assert chunks == [{"a": [1, 2], "b": [4, 5]}, {"a": [3], "b": [6]}]
+
+    def test_read_decimals_numpy_float32(self):
+        numpy = pytest.importorskip("numpy")
+        columns = numpy.zeros(2, dtype=[("price", "f4")])
+        columns["price"] = [0.1, 0.569]
+
+        assert [str(value) for value in read_decimals(columns, "price")] == [
+            "0.1",
+            "0.569",
+        ]
+
+    def test_read_decimals_arrow_float32(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        columns = pyarrow.table(
+            {"price": pyarrow.array([0.1, None, 0.569], pyarrow.float32())}
+        )
+
+        assert [
+            str(value) for value in read_decimals(columns, "price", Decimal(0))
+        ] == [
+            "0.1",
+            "0",
+            "0.569",
+        ]
+
+    def test_read_ints_numpy_float32(self):
+        numpy = pytest.importorskip("numpy")
+        columns = numpy.zeros(2, dtype=[("days", "f4")])
+        columns["days"] = [30, 15]
+
+        assert list(read_ints(columns, "days")) == [30, 15]
+
+    def test_iter_chunks_arrow_is_zero_copy(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        table = pyarrow.table({"a": [1, 2, 3]})
+        chunks = list(iter_chunks(table, chunk_size=2))
+
+        assert [chunk["a"].to_pylist() for chunk in chunks] == [[1, 2], [3]]
+        assert chunks[0]["a"].chunk(0).buffers()[1].address == (
+            table["a"].chunk(0).buffers()[1].address
+        )
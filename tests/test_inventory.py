@@ -0,0 +1,124 @@
+from decimal import Decimal
+
+from axie_money.calculators import (
+    BreedingProfitCalculator,
+    PriceConverter,
+    ScholarshipProfitCalculator,
+)
+from axie_money.inventory import InventoryCostEngine
+from axie_money.scenarios import FarmScenario
+
+
+class TestInventoryCostEngine(object):
+    price_converter = PriceConverter(
+        slp_rate=Decimal("0.08"), axs_rate=Decimal("67"), eth_rate=Decimal("3140")
+    )
+    calculator = BreedingProfitCalculator(
+        price_converter=price_converter,
+        price_floor=Decimal("0.173"),
+        price_ceiling=Decimal("0.69"),
+    )
+    engine = InventoryCostEngine(calculator)
+
+    def test_simulate_without_stock(self):
+        result = self.engine.simulate(FarmScenario(breed_count=4, parent_count=4))
+        breeding_cost = self.calculator.calculate_cumulative_breeding_cost(4, 4)
+
+        assert result.breeding_cost == result.usd_spent == breeding_cost
+        assert result.slp_used == result.axs_used == result.eth_spent == 0
+
+    def test_simulate_without_stock_rounds_like_calculator(self):
+        calculator = BreedingProfitCalculator(
+            price_converter=PriceConverter(
+                slp_rate=Decimal("0.08337"),
+                axs_rate=Decimal("67.333"),
+                eth_rate=Decimal("3140.17"),
+            ),
+            price_floor=Decimal("0.173"),
+            price_ceiling=Decimal("0.69"),
+        )
+        result = InventoryCostEngine(calculator).simulate(FarmScenario(7, 3))
+        breeding_cost = calculator.calculate_cumulative_breeding_cost(7, 3)
+
+        assert breeding_cost == Decimal("3933.41")
+        assert result.breeding_cost == result.usd_spent == breeding_cost
+
+    def test_simulate_with_stock(self):
+        result = self.engine.simulate(
+            FarmScenario(
+                breed_count=2,
+                parent_count=2,
+                slp_stock=Decimal("700"),
+                axs_stock=Decimal("1"),
+            )
+        )
+
+        # Leftover stock pays part of the second generation, the rest is bought.
+        assert result.slp_used == Decimal("700")
+        assert result.axs_used == Decimal("1")
+        assert result.usd_spent == Decimal("131.00")
+        assert result.slp_balance == 0
+        assert result.axs_balance == 0
+
+    def test_simulate_with_farmed_slp(self):
+        scholarship = ScholarshipProfitCalculator(
+            price_converter=self.price_converter,
+            min_slp=Decimal("100"),
+            max_slp=Decimal("150"),
+            percentage=Decimal("0.5"),
+        )
+        daily_slp = (
+            scholarship.calculate_manager_slp_per_day(scholarship.potential_average_slp)
+            * 4
+        )
+        result = self.engine.simulate(
+            FarmScenario(
+                breed_count=2,
+                parent_count=2,
+                daily_slp=daily_slp,
+                axs_stock=Decimal("2"),
+            ),
+            record=True,
+        )
+
+        # 5 days of 250 SLP cover the second generation's 900 SLP fee.
+        assert result.slp_used == Decimal("900")
+        assert result.usd_spent == Decimal("48.00")
+        assert len(result.balances) == 10
+        assert result.balances[4].slp == Decimal("1250")
+        assert result.balances[5].slp == Decimal("600")
+        assert result.slp_balance == Decimal("1600")
+
+    def test_simulate_with_eth(self):
+        result = self.engine.simulate(
+            FarmScenario(breed_count=1, parent_count=2, eth_stock=Decimal("0.1"))
+        )
+
+        assert result.breeding_cost == Decimal("115")
+        assert result.usd_spent == 0
+        assert result.eth_spent * 3140 == Decimal("115")
+        assert result.eth_balance == Decimal("0.1") - result.eth_spent
+
+    def test_simulate_batch(self):
+        columns = {
+            "breed_count": [4, 2],
+            "parent_count": [4, 2],
+            "slp_stock": [Decimal("0"), Decimal("700")],
+            "axs_stock": [0, 1],
+        }
+        results = self.engine.simulate_batch(columns)
+
+        assert results["breed_count"] is columns["breed_count"]
+        assert results["usd_spent"] == [
+            self.calculator.calculate_cumulative_breeding_cost(4, 4),
+            Decimal("131.00"),
+        ]
+        assert results["slp_balance"] == [0, 0]
+
+    def test_simulate_chunks(self):
+        columns = {"breed_count": [4, 2, 1], "parent_count": [4, 2, 2]}
+        chunks = list(self.engine.simulate_chunks(columns, chunk_size=2))
+
+        assert [chunk["breed_count"] for chunk in chunks] == [[4, 2], [1]]
+        assert chunks[1]["usd_spent"] == [Decimal("115.00")]
+        assert "balances" not in chunks[0]
@@ -0,0 +1,136 @@
+import datetime
+import sqlite3
+from decimal import Decimal
+
+import pytest
+
+from axie_money.calculators import BreedingProfitCalculator, ScholarshipProfitCalculator
+from axie_money.ledger import Ledger
+
+
+class TestLedger(object):
+    @pytest.fixture
+    def ledger(self):
+        ledger = Ledger()
+        ledger.add_price_snapshots(
+            [
+                ("2021-08-01", Decimal("3000"), Decimal("60"), Decimal("0.1")),
+                ("2021-08-15", Decimal("3140"), Decimal("67"), Decimal("0.08")),
+            ]
+        )
+        ledger.add_teams(
+            [
+                (1, "Team A", Decimal("0.569"), "2021-08-01"),
+                (2, "Team B", Decimal("0.569"), "2021-08-01"),
+            ]
+        )
+        ledger.add_scholars([(1, "Ana", 1, Decimal("0.5")), (2, "Ben", 2, None)])
+        ledger.add_daily_slp(
+            (scholar_id, datetime.date(2021, 9, 1) + datetime.timedelta(day), slp)
+            for scholar_id, slp in ((1, 125), (2, 200))
+            for day in range(30)
+        )
+        ledger.add_breeding_events(
+            [
+                ("2021-09-01", Decimal("2"), 4, 4, 4, 0, Decimal("0")),
+                ("2021-09-06", Decimal("2"), 4, 4, 4, 4, Decimal("0")),
+                ("2021-10-01", Decimal("2"), 4, 4, 4, 4, Decimal("40")),
+            ]
+        )
+        yield ledger
+        ledger.close()
+
+    def test_price_converter(self, ledger):
+        converter = ledger.price_converter(datetime.date(2021, 9, 1))
+
+        assert converter.eth_rate == Decimal("3140")
+        assert converter.slp_rate == Decimal("0.08")
+        assert ledger.price_converter("2021-08-14").eth_rate == Decimal("3000")
+
+    def test_price_converter_missing(self, ledger):
+        with pytest.raises(LookupError):
+            ledger.price_converter("2021-07-31")
+
+    def test_slp_history(self, ledger):
+        history = ledger.slp_history(2, start="2021-09-29")
+
+        assert history == {"date": ["2021-09-29", "2021-09-30"], "slp": [200, 200]}
+
+    def test_scholarship_columns(self, ledger):
+        calculator = ScholarshipProfitCalculator(
+            price_converter=ledger.price_converter("2021-09-30"),
+            min_slp=Decimal("100"),
+            max_slp=Decimal("150"),
+            percentage=Decimal("0.5"),
+        )
+        columns = ledger.scholarship_columns("2021-09-01", "2021-09-30")
+        results = calculator.calculate_batch(columns)
+
+        assert columns["days"] == [30, 30]
+        assert results["scholar_id"] == [1, 2]
+        assert results["roi_periods"] == [Decimal("11.91"), Decimal("7.44")]
+
+    def test_breeding_columns(self, ledger):
+        calculator = BreedingProfitCalculator(
+            price_converter=ledger.price_converter("2021-09-30"),
+            price_floor=Decimal("0.173"),
+            price_ceiling=Decimal("0.69"),
+        )
+        columns = ledger.breeding_columns("2021-09-01", "2021-09-30")
+        results = calculator.calculate_batch(columns)
+
+        assert columns["date"] == ["2021-09-01", "2021-09-06"]
+        assert results["roi_days"] == [Decimal("10.15"), Decimal("6.45")]
+
+    def test_bulk_insert_rolls_back(self, ledger):
+        with pytest.raises(sqlite3.IntegrityError):
+            ledger.add_daily_slp([(1, "2021-10-01", 100), (1, "2021-09-01", 100)])
+
+        assert ledger.slp_history(1, start="2021-10-01") == {"date": [], "slp": []}
+
+    def test_scholarship_columns_period(self, ledger):
+        calculator = ScholarshipProfitCalculator(
+            price_converter=ledger.price_converter("2021-09-30"),
+            min_slp=Decimal("100"),
+            max_slp=Decimal("150"),
+            percentage=Decimal("0.5"),
+        )
+        columns = ledger.scholarship_columns("2021-09-21", "2021-09-30")
+        results = calculator.calculate_batch(columns)
+
+        assert columns["days"] == [10, 10]
+        assert columns["period"] == [30, 30]
+        assert results["roi_periods"] == [Decimal("11.91"), Decimal("7.44")]
+
+    def test_scholarship_columns_percentage(self, ledger):
+        ledger.add_scholars([(3, "Cid", 2, Decimal("0.25"))])
+        ledger.add_daily_slp([(3, "2021-09-01", 200)])
+        calculator = ScholarshipProfitCalculator(
+            price_converter=ledger.price_converter("2021-09-30"),
+            min_slp=Decimal("100"),
+            max_slp=Decimal("150"),
+            percentage=Decimal("0.5"),
+        )
+        columns = ledger.scholarship_columns("2021-09-01", "2021-09-30")
+        results = calculator.calculate_batch(columns)
+
+        assert columns["percentage"] == [Decimal("0.5"), None, Decimal("0.25")]
+        assert results["roi_periods"] == [
+            Decimal("11.91"),
+            Decimal("7.44"),
+            Decimal("14.89"),
+        ]
+
+    def test_foreign_keys(self, ledger):
+        with pytest.raises(sqlite3.IntegrityError):
+            ledger.add_scholars([(3, "Cid", 999, None)])
+
+    def test_slp_history_uses_primary_key_range(self, ledger):
+        queries = []
+        ledger.connection.set_trace_callback(queries.append)
+        history = ledger.slp_history(1, start="2021-09-29")
+        ledger.connection.set_trace_callback(None)
+        plan = ledger.connection.execute("EXPLAIN QUERY PLAN " + queries[-1])
+
+        assert "(scholar_id=? AND date>?)" in plan.fetchone()[-1]
+        assert history == {"date": ["2021-09-29", "2021-09-30"], "slp": [125, 125]}
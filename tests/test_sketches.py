@@ -0,0 +1,107 @@
+import pickle
+import random
+import statistics
+from decimal import Decimal
+
+from axie_money.sketches import GroupedSummary, Moments, QuantileSketch, Summary
+
+RANDOM = random.Random(0)
+
+
+class TestMoments(object):
+    values = [Decimal("10.15"), Decimal("6.45"), Decimal("10"), Decimal("6.35")]
+
+    def test_update(self):
+        moments = Moments()
+        for value in self.values:
+            moments.update(value)
+
+        assert moments.count == 4
+        assert round(moments.mean, 4) == 8.2375
+        assert round(moments.variance, 6) == round(
+            statistics.variance(float(value) for value in self.values), 6
+        )
+        assert moments.min == 6.35
+        assert moments.max == 10.15
+
+    def test_merge(self):
+        left, right, whole = Moments(), Moments(), Moments()
+        for value in self.values[:1]:
+            left.update(value)
+        for value in self.values[1:]:
+            right.update(value)
+        for value in self.values:
+            whole.update(value)
+
+        left.merge(right).merge(Moments())
+
+        assert left.count == whole.count
+        assert round(left.mean, 9) == round(whole.mean, 9)
+        assert round(left.variance, 9) == round(whole.variance, 9)
+
+
+class TestQuantileSketch(object):
+    values = [RANDOM.uniform(0, 100) for _ in range(20000)]
+
+    def test_quantiles(self):
+        sketch = QuantileSketch(seed=0)
+        for value in self.values:
+            sketch.update(value)
+
+        expected = sorted(self.values)
+        for fraction in (0.01, 0.25, 0.5, 0.75, 0.99):
+            actual = sketch.quantile(fraction)
+            rank = sum(1 for value in expected if value <= actual)
+            assert abs(rank / len(expected) - fraction) < 0.02
+
+    def test_bounded_size(self):
+        sketch = QuantileSketch(k=50, seed=0)
+        for value in self.values:
+            sketch.update(value)
+
+        assert sketch.count == len(self.values)
+        assert sketch.size < 200
+        assert sum(
+            len(compactor) * 2 ** height
+            for height, compactor in enumerate(sketch.compactors)
+        ) == len(self.values)
+
+    def test_merge(self):
+        left, right = QuantileSketch(seed=0), QuantileSketch(seed=1)
+        for value in self.values[:10000]:
+            left.update(value)
+        for value in self.values[10000:]:
+            right.update(value)
+
+        left.merge(pickle.loads(pickle.dumps(right)))
+
+        assert left.count == len(self.values)
+        assert abs(left.quantile(0.5) - 50) < 3
+
+    def test_histogram(self):
+        sketch = QuantileSketch(seed=0)
+        for value in range(1, 101):
+            sketch.update(value)
+
+        assert sketch.histogram([0, 50, 100]) == [50, 50]
+
+
+class TestGroupedSummary(object):
+    def test_update_and_merge(self):
+        left, right = GroupedSummary(seed=0), GroupedSummary(seed=0)
+        for value in range(1, 101):
+            left.update("abc", value)
+            right.update("abcd", Decimal(value) / 2)
+
+        left.merge(right)
+
+        assert set(left.groups) == {"abc", "abcd"}
+        assert left["abc"].percentiles([50]) == [50]
+        assert left["abcd"].moments.mean == 25.25
+
+    def test_summary_update_many(self):
+        summary = Summary()
+        summary.update_many([1, 2, 3])
+
+        assert summary.count == 3
+        assert summary.percentiles([0, 100]) == [1, 3]